@@ -42,7 +42,7 @@ class ChatResponse(BaseModel):
 @router.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """Direct chat endpoint for web testing interface."""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     session_id = f"web_{request.session_id}"
 
@@ -83,7 +83,7 @@ async def chat(request: ChatRequest):
             pass  # Non-blocking
 
     # Record metrics
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
     success = result.get("routing_decision") != "error"
     metrics = get_enhanced_metrics_instance()
     metrics.record_channel_request("web", duration, success, request.session_id)
@@ -59,7 +59,7 @@ class RAGTestResponse(BaseModel):
 @router.post("/rag/test", response_model=RAGTestResponse)
 async def test_rag(request: RAGTestRequest):
     """Test RAG pipeline step-by-step with full visibility into each stage."""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         from app.core.rag_config import load_rag_config
@@ -100,7 +100,7 @@ async def test_rag(request: RAGTestRequest):
             return RAGTestResponse(
                 unified_processor=up_result,
                 error=f"Retrieval failed: {e}",
-                processing_time_ms=round((time.time() - start_time) * 1000, 2),
+                processing_time_ms=round((time.perf_counter() - start_time) * 1000, 2),
             )
 
     # --- Step 3: Reranking ---
@@ -175,5 +175,5 @@ async def test_rag(request: RAGTestRequest):
         quality_gate=gate_result,
         final_context=final_context,
         config_used=config_used,
-        processing_time_ms=round((time.time() - start_time) * 1000, 2),
+        processing_time_ms=round((time.perf_counter() - start_time) * 1000, 2),
     )
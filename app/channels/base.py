@@ -82,15 +82,15 @@ class BaseChannel(ABC):
         import time
         from app.monitoring.enhanced_metrics import get_enhanced_metrics_instance
 
-        start = time.time()
+        start = time.perf_counter()
         try:
             result = await self.process_message(raw_data)
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             metrics = get_enhanced_metrics_instance()
             metrics.record_request(duration, success=True)
             return result
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             metrics = get_enhanced_metrics_instance()
             metrics.record_request(duration, success=False)
             raise
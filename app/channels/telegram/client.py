@@ -4,6 +4,9 @@ Telegram Bot API client.
 Simple async HTTP client for sending messages via Telegram Bot API.
 """
 
+import asyncio
+import weakref
+
 import httpx
 from typing import Optional
 
@@ -16,6 +19,23 @@ class TelegramClient:
     def __init__(self, token: Optional[str] = None):
         self.token = token or settings.TELEGRAM_BOT_TOKEN
         self.base_url = f"https://api.telegram.org/bot{self.token}"
+        # One pooled HTTP client per event loop (keep-alive across calls)
+        self._http_clients = weakref.WeakKeyDictionary()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=30.0)
+            self._http_clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client for the running event loop."""
+        client = self._http_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
 
     async def send_message(
         self,
@@ -47,16 +67,16 @@ class TelegramClient:
             payload["reply_parameters"] = {"message_id": reply_to_message_id}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/sendMessage",
-                    json=payload,
-                )
-                if response.status_code == 200:
-                    return True
-                else:
-                    print(f"Telegram API error: {response.status_code} - {response.text}")
-                    return False
+            response = await self._get_http_client().post(
+                f"{self.base_url}/sendMessage",
+                json=payload,
+                timeout=30.0,
+            )
+            if response.status_code == 200:
+                return True
+            else:
+                print(f"Telegram API error: {response.status_code} - {response.text}")
+                return False
         except Exception as e:
             print(f"Failed to send Telegram message: {e}")
             return False
@@ -64,20 +84,22 @@ class TelegramClient:
     async def get_webhook_info(self) -> dict:
         """Get current webhook configuration."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/getWebhookInfo")
-                if response.status_code == 200:
-                    return response.json().get("result", {})
-                return {"error": f"HTTP {response.status_code}"}
+            response = await self._get_http_client().get(
+                f"{self.base_url}/getWebhookInfo", timeout=10.0
+            )
+            if response.status_code == 200:
+                return response.json().get("result", {})
+            return {"error": f"HTTP {response.status_code}"}
         except Exception as e:
             return {"error": str(e)}
 
     async def delete_webhook(self) -> bool:
         """Delete the current webhook."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(f"{self.base_url}/deleteWebhook")
-                return response.status_code == 200
+            response = await self._get_http_client().post(
+                f"{self.base_url}/deleteWebhook", timeout=10.0
+            )
+            return response.status_code == 200
         except Exception as e:
             print(f"Failed to delete webhook: {e}")
             return False
@@ -85,11 +107,12 @@ class TelegramClient:
     async def get_me(self) -> dict:
         """Get bot info."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/getMe")
-                if response.status_code == 200:
-                    return response.json().get("result", {})
-                return {"error": f"HTTP {response.status_code}"}
+            response = await self._get_http_client().get(
+                f"{self.base_url}/getMe", timeout=10.0
+            )
+            if response.status_code == 200:
+                return response.json().get("result", {})
+            return {"error": f"HTTP {response.status_code}"}
         except Exception as e:
             return {"error": str(e)}
 
@@ -106,6 +129,12 @@ def get_telegram_client() -> TelegramClient:
     return _telegram_client
 
 
+async def close_telegram_client() -> None:
+    """Close the global client's pooled HTTP connections (app shutdown)."""
+    if _telegram_client is not None:
+        await _telegram_client.aclose()
+
+
 async def send_telegram_message(
     chat_id: int, text: str, reply_to_message_id: Optional[int] = None
 ) -> bool:
@@ -12,6 +12,9 @@ from typing import Dict, Any
 from app.channels.base import BaseChannel
 from app.config import settings
 
+# Chat types that use per-user sessions inside a shared chat
+_GROUP_CHAT_TYPES = frozenset({"group", "supergroup", "channel"})
+
 
 class TelegramChannel(BaseChannel):
     """
@@ -32,6 +35,8 @@ class TelegramChannel(BaseChannel):
         self.memory = get_telegram_memory()
         self.client = get_telegram_client()
         self.bot_username = getattr(settings, 'TELEGRAM_BOT_USERNAME', 'z3_agent_bot')
+        # Normalized once; Telegram usernames are case-insensitive
+        self._bot_usernames = frozenset({self.bot_username.casefold()})
         
         print(f"🤖 TelegramChannel initialized")
     
@@ -227,7 +232,7 @@ class TelegramChannel(BaseChannel):
             
             # Determine if this is a group chat
             chat_type = chat.get("type", "private")
-            is_group = chat_type in ["group", "supergroup", "channel"]
+            is_group = chat_type in _GROUP_CHAT_TYPES
             
             # Extract message content
             message_text = message.get("text", "").strip()
@@ -288,8 +293,8 @@ class TelegramChannel(BaseChannel):
             return False
         
         # Skip messages from the bot itself
-        username = message_data.get('username', '')
-        if username == self.bot_username:
+        username = message_data.get('username') or ''
+        if username.casefold() in self._bot_usernames:
             print(f"🔄 Skipping message from bot itself: {username}")
             return False
         
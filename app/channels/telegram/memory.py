@@ -6,11 +6,15 @@ LangChain's SQLChatMessageHistory with support for both PostgreSQL (production)
 and SQLite (development).
 """
 
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 
 from langchain_community.chat_message_histories import SQLChatMessageHistory
+from langchain_community.chat_message_histories.sql import DefaultMessageConverter
 from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
 
 from app.config import settings
 
@@ -26,6 +30,9 @@ class TelegramMemory:
     - Simple conversation storage and retrieval
     """
 
+    # Number of recent messages included in AI context
+    HISTORY_WINDOW = 10
+
     def __init__(self, db_path: Optional[str] = None, database_url: Optional[str] = None):
         """
         Initialize Telegram memory manager.
@@ -55,6 +62,36 @@ class TelegramMemory:
             self.connection_string = f"sqlite:///{self.db_path}"
             self.db_type = "sqlite"
             print(f"🧠 TelegramMemory initialized: SQLite ({self.db_path})")
+
+        # Built once: every DefaultMessageConverter declares a new ORM model class
+        self.converter = DefaultMessageConverter("message_store")
+        self.message_model = self.converter.get_sql_model_class()
+
+        # Shared engine so every history lookup reuses the connection pool
+        self.engine = None
+        try:
+            self.engine = create_engine(self.connection_string)
+            if self.db_type == "sqlite":
+                event.listen(self.engine, "connect", _configure_sqlite_connection)
+        except Exception as e:
+            # Memory failures shouldn't break message processing, run without history
+            print(f"⚠️ Failed to create memory engine: {e}")
+
+        if self.engine is not None:
+            self._ensure_schema()
+
+    def _ensure_schema(self):
+        """Create the LangChain message table and the per-session lookup index."""
+        try:
+            self.message_model.metadata.create_all(self.engine)
+            with self.engine.connect() as conn:
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_message_store_session_id "
+                    "ON message_store (session_id, id)"
+                ))
+                conn.commit()
+        except Exception as e:
+            print(f"⚠️ Failed to prepare memory schema: {e}")
     
     def _get_session_history(self, session_id: str) -> BaseChatMessageHistory:
         """
@@ -70,8 +107,29 @@ class TelegramMemory:
         """
         return SQLChatMessageHistory(
             session_id=session_id,
-            connection=self.connection_string
+            connection=self.engine,
+            custom_message_converter=self.converter
         )
+
+    def _get_recent_messages(self, session_id: str, limit: int) -> List[BaseMessage]:
+        """
+        Load only the last `limit` messages of a session, oldest first.
+
+        SQLChatMessageHistory.messages loads the whole session, so the
+        window is applied in SQL instead to keep reads bounded.
+        """
+        model = self.message_model
+
+        with Session(self.engine) as db:
+            records = (
+                db.query(model)
+                .where(model.session_id == session_id)
+                .order_by(model.id.desc())
+                .limit(limit)
+                .all()
+            )
+
+        return [self.converter.from_sql_model(record) for record in reversed(records)]
     
     def get_history(self, session_id: str) -> str:
         """
@@ -83,17 +141,19 @@ class TelegramMemory:
         Returns:
             str: Formatted conversation history or empty string
         """
+        if self.engine is None:
+            return ""
+
         try:
-            history = self._get_session_history(session_id)
-            messages = history.messages
+            messages = self._get_recent_messages(session_id, self.HISTORY_WINDOW)
             
             if not messages:
                 return ""
             
-            # Format last 10 messages for AI context
+            # Format recent messages for AI context
             # Using "User"/"Bot" for token efficiency (shorter than "Human"/"Assistant")
             formatted_history = []
-            for msg in messages[-10:]:
+            for msg in messages:
                 role = "User" if msg.type == "human" else "Bot"
                 formatted_history.append(f"{role}: {msg.content}")
 
@@ -112,12 +172,18 @@ class TelegramMemory:
             user_message: User's input message
             bot_reply: Bot's generated response
         """
+        if self.engine is None:
+            return
+
         try:
-            history = self._get_session_history(session_id)
-            
-            # Add user message and bot reply
-            history.add_user_message(user_message)
-            history.add_ai_message(bot_reply)
+            # Write through the shared model; constructing SQLChatMessageHistory
+            # would re-run create_all on every save
+            with Session(self.engine) as db:
+                db.add_all([
+                    self.converter.to_sql_model(HumanMessage(content=user_message), session_id),
+                    self.converter.to_sql_model(AIMessage(content=bot_reply), session_id),
+                ])
+                db.commit()
             
             print(f"💾 Saved interaction for session: {session_id}")
                 
@@ -126,6 +192,17 @@ class TelegramMemory:
             # Don't raise - memory failures shouldn't break message processing
 
 
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """
+    WAL lets history reads run alongside writes instead of waiting on the
+    file lock; synchronous=NORMAL is durable enough in WAL mode.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 # Simple factory function
 def create_telegram_memory(db_path: Optional[str] = None) -> TelegramMemory:
     """
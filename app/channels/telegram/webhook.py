@@ -161,7 +161,10 @@ async def telegram_health():
         from app.channels.telegram.memory import get_telegram_memory
 
         memory = get_telegram_memory()
-        result["components"]["memory"] = f"{memory.db_type} connected"
+        if memory.engine is not None:
+            result["components"]["memory"] = f"{memory.db_type} connected"
+        else:
+            result["components"]["memory"] = f"{memory.db_type} unavailable"
     except Exception as e:
         result["components"]["memory"] = f"error: {e}"
 
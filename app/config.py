@@ -85,6 +85,13 @@ class Settings(BaseSettings):
     # Reply Generation
     REPLY_TEMPERATURE: float = Field(0.7, alias="REPLY_TEMPERATURE")
 
+    # Response Cache (max cached chain results, 0 = disabled)
+    RESPONSE_CACHE_SIZE: int = Field(256, alias="RESPONSE_CACHE_SIZE")
+    RESPONSE_CACHE_TTL_SECONDS: float = Field(300.0, alias="RESPONSE_CACHE_TTL_SECONDS")
+
+    # Max chain invocations running in worker threads at once
+    CHAIN_MAX_CONCURRENCY: int = Field(8, alias="CHAIN_MAX_CONCURRENCY")
+
     # Logging
     LOG_LEVEL: str = Field("INFO", alias="LOG_LEVEL")
     
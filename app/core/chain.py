@@ -8,12 +8,20 @@ Simplified architecture:
 - Supports HITL escalation flow
 """
 
-from typing import Dict, Any
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from langchain_core.runnables import Runnable
 
 from app.core.reply import generate_telegram_reply, generate_social_reply
 from app.config import settings
 
+# Routing decisions that require context retrieval
+_RAG_ROUTES = frozenset({"docs", "web", "all"})
+
 
 class CoreChain(Runnable):
     """
@@ -31,12 +39,29 @@ class CoreChain(Runnable):
        - HITL escalation support
 
     Mode is controlled by AGENT_MODE config (social/cs).
+
+    Results are kept in an in-memory LRU (with TTL) keyed by agent mode,
+    normalized message and conversation history, so an identical turn in an
+    identical conversation state skips the LLM/RAG pipeline entirely. Only
+    results backed by real LLM output are cached.
     """
 
     def __init__(self):
         super().__init__()
         agent_mode = settings.AGENT_MODE.lower()
 
+        # Response cache (invoke runs in worker threads, hence the lock)
+        self._cache_max_size = max(settings.RESPONSE_CACHE_SIZE, 0)
+        self._cache_ttl = settings.RESPONSE_CACHE_TTL_SECONDS
+        self._response_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Caps concurrent ainvoke calls; the default thread pool alone would
+        # allow min(32, cpu + 4) blocking LLM/RAG pipelines at once
+        self._concurrency = asyncio.Semaphore(max(settings.CHAIN_MAX_CONCURRENCY, 1))
+
         if agent_mode == "social":
             print(f"CoreChain initialized (Agent Mode: SOCIAL - casual replies only)")
         else:
@@ -56,13 +81,76 @@ class CoreChain(Runnable):
         # Check agent mode
         agent_mode = settings.AGENT_MODE.lower()
 
+        cache_key = self._cache_key(agent_mode, text, history)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         if agent_mode == "social":
-            return self._invoke_social(text, history)
+            result = self._invoke_social(text, history)
         elif agent_mode == "cs":
-            return self._invoke_unified(text, history)
+            result = self._invoke_unified(text, history)
         else:
             print(f"WARNING: Unknown AGENT_MODE '{agent_mode}', defaulting to social")
-            return self._invoke_social(text, history)
+            result = self._invoke_social(text, history)
+
+        # Only cache LLM replies: failures and degraded routing may succeed next
+        # time, and escalations carry a fixed message, not an LLM reply
+        if (
+            result.get("routing_decision") != "error"
+            and not result.get("routing_fallback")
+            and not result.get("escalated")
+        ):
+            self._cache_set(cache_key, result)
+
+        return result
+
+    @staticmethod
+    def _cache_key(agent_mode: str, text: str, history: str) -> bytes:
+        """Hash of mode + normalized message + full history window."""
+        normalized = " ".join(text.casefold().split())
+        raw = f"{agent_mode}\x1f{normalized}\x1f{history}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None on miss/expiry."""
+        if not self._cache_max_size:
+            return None
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._response_cache[key]
+                entry = None
+            if entry is None:
+                self.cache_misses += 1
+                return None
+            result = entry[1]
+            self._response_cache.move_to_end(key)
+            self.cache_hits += 1
+        return dict(result)
+
+    def _cache_set(self, key: bytes, result: Dict[str, Any]) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        if not self._cache_max_size:
+            return
+        with self._cache_lock:
+            self._response_cache[key] = (time.monotonic() + self._cache_ttl, dict(result))
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self._cache_max_size:
+                self._response_cache.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Response cache statistics."""
+        with self._cache_lock:
+            return {
+                "agent_mode": settings.AGENT_MODE.lower(),
+                "cache_enabled": bool(self._cache_max_size),
+                "cache_size": len(self._response_cache),
+                "cache_max_size": self._cache_max_size,
+                "cache_ttl_seconds": self._cache_ttl,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+            }
 
     def _invoke_unified(self, text: str, history: str) -> Dict[str, Any]:
         """Process using unified processor (Phase 1 flow)."""
@@ -91,7 +179,7 @@ class CoreChain(Runnable):
             quality_action = "proceed"
             quality_score = 0.0
 
-            if routing_decision in ["docs", "web", "all"]:
+            if routing_decision in _RAG_ROUTES:
                 from app.core.rag import retrieve_context_with_quality
 
                 # Use reformulated query for better retrieval
@@ -132,6 +220,7 @@ class CoreChain(Runnable):
                 "reformulated_query": reformulated_query,
                 "quality_score": quality_score,
                 "flagged_for_review": flagged,
+                "routing_fallback": processor_result.get("fallback", False),
                 "escalated": False
             }
 
@@ -243,8 +332,16 @@ class CoreChain(Runnable):
         }
 
     async def ainvoke(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        """Async version - delegates to sync invoke."""
-        return self.invoke(inputs)
+        """
+        Async version - runs sync invoke in a worker thread.
+
+        The LLM/RAG calls are blocking, so running them off the event loop
+        lets concurrent webhook updates and chat requests overlap instead
+        of queueing behind each other. At most CHAIN_MAX_CONCURRENCY run
+        at once; further calls wait for a free slot.
+        """
+        async with self._concurrency:
+            return await asyncio.to_thread(self.invoke, inputs)
 
 
 # Global instance
@@ -8,24 +8,74 @@ Features:
 """
 
 from __future__ import annotations
-from typing import Literal, Dict, Any, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Literal, Dict, Any, Optional, Tuple
 from functools import lru_cache
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class QualityGateResult:
-    """Result from quality gate evaluation."""
+    """Result from quality gate evaluation (immutable, cached results are shared)."""
     action: str  # "proceed", "proceed_with_flag", "escalate"
     top_score: float
     context: str
     reasoning: str
 
 
-# Lazy-load reranker to avoid startup overhead
-@lru_cache(maxsize=1)
+# Retrieval cache: (mode, normalized query, k_docs, k_web, max_len) -> (expires_at, result)
+_RETRIEVAL_CACHE_MAX_SIZE = 512
+_RETRIEVAL_CACHE_TTL_DOCS = 3600.0  # docs only change on index rebuild
+_RETRIEVAL_CACHE_TTL_WEB = 300.0  # web results go stale quickly
+_retrieval_cache: "OrderedDict[tuple, Tuple[float, QualityGateResult]]" = OrderedDict()
+_retrieval_cache_lock = threading.Lock()
+
+
+def _retrieval_cache_get(key: tuple) -> Optional[QualityGateResult]:
+    """Get a cached retrieval result if present and not expired."""
+    with _retrieval_cache_lock:
+        entry = _retrieval_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del _retrieval_cache[key]
+            return None
+        _retrieval_cache.move_to_end(key)
+        return result
+
+
+def _retrieval_cache_set(key: tuple, result: QualityGateResult, ttl: float) -> None:
+    """Cache a retrieval result, evicting least recently used entries."""
+    with _retrieval_cache_lock:
+        _retrieval_cache[key] = (time.monotonic() + ttl, result)
+        _retrieval_cache.move_to_end(key)
+        while len(_retrieval_cache) > _RETRIEVAL_CACHE_MAX_SIZE:
+            _retrieval_cache.popitem(last=False)
+
+
+def clear_retrieval_cache() -> None:
+    """Drop all cached retrieval results (e.g. after rebuilding the index)."""
+    with _retrieval_cache_lock:
+        _retrieval_cache.clear()
+
+
+# Lazy-load reranker to avoid startup overhead. lru_cache alone doesn't stop
+# concurrent first calls (worker threads) from each loading the model.
+_reranker_lock = threading.Lock()
+
+
 def _get_reranker():
     """Get singleton reranker instance."""
+    with _reranker_lock:
+        return _load_reranker()
+
+
+@lru_cache(maxsize=1)
+def _load_reranker():
+    """Build the reranker from RAG config (call via _get_reranker)."""
     from app.core.reranker import BGEReranker
     from app.core.rag_config import load_rag_config
 
@@ -105,7 +155,15 @@ def retrieve_context_with_quality(
 
     Returns:
         QualityGateResult with action, score, context, and reasoning
+
+    Results with non-empty context are cached per normalized query
+    (1h for docs, 5 min when web search is involved).
     """
+    cache_key = (mode, " ".join(query.casefold().split()), k_docs, k_web, max_len)
+    cached = _retrieval_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     from app.core.rag_config import load_rag_config
 
     # Load config
@@ -214,13 +272,20 @@ def retrieve_context_with_quality(
     # Quality gate evaluation
     gate_result = quality_gate(top_score, rag_config)
 
-    return QualityGateResult(
+    result = QualityGateResult(
         action=gate_result["action"],
         top_score=top_score,
         context=context,
         reasoning=gate_result["reasoning"]
     )
 
+    # Empty context may be a transient failure (search error, missing index)
+    if context:
+        ttl = _RETRIEVAL_CACHE_TTL_DOCS if mode == "docs" else _RETRIEVAL_CACHE_TTL_WEB
+        _retrieval_cache_set(cache_key, result, ttl)
+
+    return result
+
 
 def retrieve_context(
     query: str,
@@ -249,6 +314,7 @@ def rebuild_index() -> None:
     """Rebuild the FAISS vector index."""
     from app.services.vector import build_index
     build_index()
+    clear_retrieval_cache()
 
 
 def _safe_content(text: str, max_len: int = 2_000) -> str:
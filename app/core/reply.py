@@ -19,11 +19,17 @@ def _get_reply_temperature() -> float:
     return settings.REPLY_TEMPERATURE
 
 
+@lru_cache(maxsize=1)
+def _load_reply_config() -> dict:
+    """Read reply JSON config once (errors are not cached, so they retry)."""
+    with open(_get_reply_config_path(), encoding="utf-8") as f:
+        return json.load(f)
+
+
 # Load from professional customer service JSON config
 def _get_reply_template():
     try:
-        with open(_get_reply_config_path(), encoding="utf-8") as f:
-            config = json.load(f)
+        config = _load_reply_config()
         return config.get("reply_template", "{persona_intro}\n\n{rules}\n\nUser: \"{comment}\"\n\nInformasi tambahan (bisa internal docs atau web):\n{context}\n\nJawaban Admin AI:")
     except Exception as e:
         print(f"WARNING: Failed to load reply config, using fallback: {e}")
@@ -33,8 +39,7 @@ def _get_reply_template():
 def _format_optimized_template(comment: str, context: str, history: str = "") -> dict:
     """Format optimized customer service template"""
     try:
-        with open(_get_reply_config_path(), encoding="utf-8") as f:
-            config = json.load(f)
+        config = _load_reply_config()
         
         identity = config.get("identity", {})
         service_guidelines = config.get("service_guidelines", [])
@@ -86,43 +91,55 @@ def _get_llm() -> ChatGoogleGenerativeAI:
     )
 
 
+_PROMPT_SEPARATOR = "=" * 60
+
+
+def _print_prompt(title: str, content: str) -> None:
+    """
+    Print a prompt dump as a single write so concurrent requests don't interleave.
+
+    Only enabled with LOG_LEVEL=DEBUG; full prompts are too noisy for production logs.
+    """
+    if settings.LOG_LEVEL.upper() != "DEBUG":
+        return
+    print(f"{title}\n{_PROMPT_SEPARATOR}\n{content}\n{_PROMPT_SEPARATOR}")
+
+
 def generate_telegram_reply(
     comment: str,
     context: Optional[str] = "",
     history_context: Optional[str] = ""
 ) -> str:
-    try:
-        # Use same template system as Instagram but without Instagram-specific logic
-        template_vars = _format_optimized_template(
-            comment=comment,
-            context=context or "",
-            history=history_context or ""
-        )
-
-        messages = _get_reply_prompt_template().format_messages(**template_vars)
-        
-        # Show final prompt for debugging
-        print(f"🔍 TELEGRAM FINAL PROMPT TO LLM:")
-        print(f"{'='*60}")
-        print(messages[0].content)
-        print(f"{'='*60}")
-        
-        ai_msg = _get_llm().invoke(messages)
-        reply = ai_msg.content.strip()
-        print(f"INFO: Generated Telegram reply")
-        
-    except Exception as e:
-        print(f"ERROR: Telegram reply generation failed - error: {e}")
-        reply = "Sorry, I encountered an issue processing your message. Please try again."
+    # Use same template system as Instagram but without Instagram-specific logic
+    template_vars = _format_optimized_template(
+        comment=comment,
+        context=context or "",
+        history=history_context or ""
+    )
+
+    messages = _get_reply_prompt_template().format_messages(**template_vars)
+    
+    # Show final prompt for debugging
+    _print_prompt("🔍 TELEGRAM FINAL PROMPT TO LLM:", messages[0].content)
+    
+    ai_msg = _get_llm().invoke(messages)
+    reply = ai_msg.content.strip()
+    print(f"INFO: Generated Telegram reply")
 
     return reply
 
 
+@lru_cache(maxsize=1)
+def _read_social_prompt() -> str:
+    """Read social prompt file once per process."""
+    with open(settings.SOCIAL_PROMPT_PATH, encoding="utf-8") as f:
+        return f.read()
+
+
 def _load_social_prompt_template() -> str:
     """Load social prompt template from file."""
     try:
-        with open(settings.SOCIAL_PROMPT_PATH, encoding="utf-8") as f:
-            return f.read()
+        return _read_social_prompt()
     except Exception as e:
         print(f"WARNING: Failed to load social prompt, using fallback: {e}")
         return """Kamu adalah z3, sebuah akun media sosial yang friendly dan santai.
@@ -137,6 +154,10 @@ Balas dengan gaya santai dan natural.
 Jawaban:"""
 
 
+# Passthrough template wrapping the pre-formatted social prompt
+_SOCIAL_PROMPT_WRAPPER = ChatPromptTemplate.from_template("{prompt}")
+
+
 def generate_social_reply(
     comment: str,
     history_context: Optional[str] = ""
@@ -152,33 +173,27 @@ def generate_social_reply(
 
     Returns:
         Casual reply string
-    """
-    try:
-        # Load prompt template from file
-        prompt_template = _load_social_prompt_template()
 
-        # Format with variables
-        formatted_prompt = prompt_template.format(
-            history=history_context or "Belum ada percakapan sebelumnya.",
-            comment=comment
-        )
+    Raises:
+        Exception: If prompt formatting or the LLM call fails; CoreChain
+        turns this into an error result with its own fallback reply.
+    """
+    # Load prompt template from file
+    prompt_template = _load_social_prompt_template()
 
-        messages = ChatPromptTemplate.from_template("{prompt}").format_messages(
-            prompt=formatted_prompt
-        )
+    # Format with variables
+    formatted_prompt = prompt_template.format(
+        history=history_context or "Belum ada percakapan sebelumnya.",
+        comment=comment
+    )
 
-        # Debug log
-        print(f"🔍 SOCIAL MODE PROMPT:")
-        print(f"{'='*60}")
-        print(messages[0].content)
-        print(f"{'='*60}")
+    messages = _SOCIAL_PROMPT_WRAPPER.format_messages(prompt=formatted_prompt)
 
-        ai_msg = _get_llm().invoke(messages)
-        reply = ai_msg.content.strip()
-        print(f"INFO: Generated social reply (no RAG)")
+    # Debug log
+    _print_prompt("🔍 SOCIAL MODE PROMPT:", messages[0].content)
 
-    except Exception as e:
-        print(f"ERROR: Social reply generation failed - error: {e}")
-        reply = "Halo! Ada yang bisa aku bantu?"
+    ai_msg = _get_llm().invoke(messages)
+    reply = ai_msg.content.strip()
+    print(f"INFO: Generated social reply (no RAG)")
 
     return reply
@@ -8,6 +8,7 @@ Phase 1 Implementation - RAG Orchestration v2
 """
 
 import json
+import re
 from typing import Dict, Any, Optional
 from functools import lru_cache
 from pathlib import Path
@@ -16,6 +17,20 @@ from google import genai
 from google.genai import types
 
 
+# Pure greetings / thanks opening a conversation: routed "direct" with no
+# escalation, so they are answered without spending an LLM call on routing.
+# Only used without history; mid-conversation, short words like "sore" may
+# answer a bot question and need the LLM to resolve them.
+_SMALL_TALK_PATTERN = re.compile(
+    r"^(?:halo+|hai+|hi+|hello|hey|pagi|siang|sore|malam"
+    r"|selamat (?:pagi|siang|sore|malam)"
+    r"|terima ?kasih|makasih|thanks|thank you|thx)"
+    r"(?:[\s,]+(?:kak|kakak|min|admin|ya+|banyak|semua|bot|z3|apa kabar))*"
+    r"[\s!.,?]*$",
+    re.IGNORECASE,
+)
+
+
 class UnifiedProcessor:
     """
     Unified agent that handles:
@@ -140,6 +155,10 @@ Query: "halo" | History: ""
             - escalation_reason: str
             - reasoning: str
         """
+        # Fast path: opening small talk doesn't need LLM routing
+        if not history and _SMALL_TALK_PATTERN.match(query.strip()):
+            return self._small_talk_response(query)
+
         # Format prompt
         prompt = self.prompt_template.format(
             query=query,
@@ -190,6 +209,18 @@ Query: "halo" | History: ""
             print(f"ERROR: UnifiedProcessor failed: {e}")
             return self._fallback_response(query)
 
+    def _small_talk_response(self, query: str) -> Dict[str, Any]:
+        """Direct-route response for greetings/thanks matched without LLM."""
+        return {
+            "routing_decision": "direct",
+            "resolved_query": query,
+            "needs_reformulation": False,
+            "reformulated_query": query,
+            "escalate": False,
+            "escalation_reason": "",
+            "reasoning": "Small talk matched by pattern, LLM routing skipped"
+        }
+
     def _fallback_response(self, query: str) -> Dict[str, Any]:
         """Fallback response when processing fails."""
         return {
@@ -199,7 +230,8 @@ Query: "halo" | History: ""
             "reformulated_query": query,
             "escalate": False,
             "escalation_reason": "",
-            "reasoning": "Fallback response due to processing error"
+            "reasoning": "Fallback response due to processing error",
+            "fallback": True
         }
 
 
@@ -14,6 +14,8 @@ async def lifespan(app: FastAPI):
     print(">> Startup mulai")
     print(">> FastAPI startup complete")
     yield
+    from app.channels.telegram.client import close_telegram_client
+    await close_telegram_client()
     print(">>> FastAPI shutdown")
 
 app = FastAPI(
@@ -54,8 +56,12 @@ async def basic_metrics():
 @app.get("/metrics")
 async def enhanced_metrics():
     """Enhanced metrics endpoint with channel-specific data"""
+    from app.core.chain import get_core_chain
+
     metrics = get_enhanced_metrics_instance()
-    return metrics.get_enhanced_stats()
+    stats = metrics.get_enhanced_stats()
+    stats["response_cache"] = get_core_chain().get_stats()
+    return stats
 
 @app.get("/metrics/alerts")
 async def alert_status():
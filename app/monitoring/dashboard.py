@@ -18,11 +18,18 @@ try:
         initial_sidebar_state="collapsed",
     )
 
+    @st.cache_resource
+    def _get_http_session() -> requests.Session:
+        """Keep-alive session shared across dashboard reruns."""
+        return requests.Session()
+
+    session = _get_http_session()
+
     st.title("z3-Agent Monitoring Dashboard")
 
     # Fetch metrics
     try:
-        metrics = requests.get(f"{API_BASE}/metrics", timeout=5).json()
+        metrics = session.get(f"{API_BASE}/metrics", timeout=5).json()
     except Exception:
         st.error("Cannot connect to backend. Is it running?")
         st.stop()
@@ -63,7 +70,7 @@ try:
     # Recent requests
     st.subheader("Recent Requests")
     try:
-        req_data = requests.get(f"{API_BASE}/metrics/requests", timeout=5).json()
+        req_data = session.get(f"{API_BASE}/metrics/requests", timeout=5).json()
         recent = req_data.get("recent_requests", [])
         if recent:
             st.dataframe(recent, use_container_width=True)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import threading
 from functools import lru_cache
 from pathlib import Path
 from typing import List, TYPE_CHECKING
@@ -13,6 +14,11 @@ from app.config import settings
 _DOCS_DIR = Path(settings.DOCS_DIR)
 _VEC_DIR = Path(settings.VECTOR_DIR)
 
+# Serializes embedding/index loading and index builds: retrieval runs in
+# worker threads, and lru_cache doesn't stop concurrent cold starts from
+# each loading the models or writing _VEC_DIR at the same time.
+_index_lock = threading.RLock()
+
 def _index_exists() -> bool:
     return (_VEC_DIR / "index.faiss").exists()
 
@@ -61,16 +67,16 @@ def _load_vectordb() -> "FAISS":
     return vectordb
 
 def get_retriever() -> "FAISS":
-    try:
-        vectordb = _load_vectordb()
-    except Exception as e:
-        if _index_exists():
-            print(f"ERROR: Failed to load FAISS index - error: {e}")
-            raise
-        print("WARNING: Vector index not found, building…")
-        build_index()
-        _load_vectordb.cache_clear()
-        vectordb = _load_vectordb()
+    with _index_lock:
+        try:
+            vectordb = _load_vectordb()
+        except Exception as e:
+            if _index_exists():
+                print(f"ERROR: Failed to load FAISS index - error: {e}")
+                raise
+            print("WARNING: Vector index not found, building…")
+            build_index()
+            vectordb = _load_vectordb()
 
     # Load retrieval_k from RAG config
     from app.core.rag_config import load_rag_config
@@ -85,16 +91,19 @@ def get_retriever() -> "FAISS":
     return vectordb.as_retriever(search_kwargs={"k": retrieval_k})
 
 def build_index() -> None:
-    print(f"INFO: Building vector index from docs - docs_dir: {_DOCS_DIR}")
-    docs = _load_raw_docs()
-    split_docs = _split_docs(docs)
-    from langchain_community.vectorstores.faiss import FAISS
+    with _index_lock:
+        print(f"INFO: Building vector index from docs - docs_dir: {_DOCS_DIR}")
+        docs = _load_raw_docs()
+        split_docs = _split_docs(docs)
+        from langchain_community.vectorstores.faiss import FAISS
 
-    vectordb = FAISS.from_documents(split_docs, _get_embeddings())
+        vectordb = FAISS.from_documents(split_docs, _get_embeddings())
 
-    _VEC_DIR.mkdir(parents=True, exist_ok=True)
-    vectordb.save_local(str(_VEC_DIR))
-    print(f"INFO: Vector index saved - path: {_VEC_DIR}, total: {len(split_docs)}")
+        _VEC_DIR.mkdir(parents=True, exist_ok=True)
+        vectordb.save_local(str(_VEC_DIR))
+        # Next get_retriever() picks up the new index
+        _load_vectordb.cache_clear()
+        print(f"INFO: Vector index saved - path: {_VEC_DIR}, total: {len(split_docs)}")
 
 def _load_raw_docs() -> List[Document]:
     from langchain_community.document_loaders import (